@@ -1,15 +1,26 @@
 import os
-import requests
+import httpx
 import time
 import random
 import sys
-import urllib3
 import argparse
 import re
+import threading
+import queue
+import socket
+import ipaddress
+import operator
 from datetime import datetime
+from collections import namedtuple
+from importlib.util import find_spec
+from urllib.parse import urlparse, quote
+from urllib.request import getproxies, proxy_bypass
 
-# Disable SSL warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# Characters left as-is when quoting file names into URL paths (same as requests)
+URL_PATH_SAFE = "/!$&'()*+,;=:@~"
+
+# HTTP/2 needs the optional 'h2' package (pip install httpx[http2])
+HTTP2_AVAILABLE = find_spec('h2') is not None
 
 # ANSI color codes
 COLOR_RESET = '\033[0m'
@@ -20,6 +31,77 @@ COLOR_WARN = '\033[33m'  # Orange/Yellow
 COLOR_INFO = '\033[34m'  # Blue
 COLOR_CYAN = '\033[36m'  # Cyan
 
+STATUS_COLOR = {
+    200: COLOR_SUCCESS, 204: COLOR_SUCCESS,
+    301: COLOR_INFO, 302: COLOR_INFO, 307: COLOR_INFO,
+    401: COLOR_WARN, 403: COLOR_WARN
+}
+
+def color_for(code):
+    return STATUS_COLOR.get(code) or (COLOR_ERROR if code >= 500 else COLOR_DEFAULT)
+
+RESULT_FORMAT = (
+    "{rel_path:<30} " + COLOR_RESET + "[Status: {color}{status}" + COLOR_RESET +
+    ", Size: {size}, Words: {words}, Lines: {lines}, Duration: {duration}ms]"
+)
+
+# Unread bodies up to this many bytes on the wire are drained so the connection
+# can be reused; larger ones are dropped by closing the connection instead
+DRAIN_LIMIT = 64 * 1024
+
+# Result lines from the workers, written out by a single printer thread
+out_q = queue.Queue()
+PRINT_BATCH = 32
+
+def printer():
+    """
+    Writes queued result lines to stdout in batches until it gets None.
+    A batch is flushed as soon as the queue runs dry, so output stays live.
+    """
+    buf = []
+    while True:
+        item = out_q.get()
+        if item is not None:
+            buf.append(item)
+        if buf and (item is None or len(buf) >= PRINT_BATCH or out_q.empty()):
+            sys.stdout.write("\n".join(buf) + "\n")
+            sys.stdout.flush()
+            buf.clear()
+        if item is None:
+            return
+
+# Per-thread RNG so workers don't draw the same delays in lockstep
+_thread_local = threading.local()
+
+def random_delay(low, high):
+    rng = getattr(_thread_local, 'rng', None)
+    if rng is None:
+        rng = _thread_local.rng = random.Random()
+    time.sleep(rng.uniform(low, high))
+
+class RateLimiter:
+    """
+    Token bucket shared by all workers, allowing `rate` requests per second.
+    Callers that find the bucket empty reserve the next token and sleep
+    until it is due, so requests stay evenly spaced across threads.
+    """
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0
+        if delay > 0:
+            time.sleep(delay)
+
 def print_banner():
     banner = r"""
   ____    _    ____ ___  ____  
@@ -36,7 +118,7 @@ def print_banner():
 
 def parse_range_list(value_str):
     """
-    Parses a string like "200,300-305,404" into a set of integers.
+    Parses a string like "200,300-305,404" into a frozenset of integers.
     Returns None if input is None or empty.
     """
     if not value_str:
@@ -59,7 +141,7 @@ def parse_range_list(value_str):
                 res.add(int(part))
             except ValueError:
                 continue
-    return res
+    return frozenset(res)
 
 def parse_headers(header_list):
     headers = {}
@@ -70,128 +152,340 @@ def parse_headers(header_list):
                 headers[key.strip()] = val.strip()
     return headers
 
-def match_value(value, criteria, mode='exact'):
+def parse_jitter(value_str):
     """
-    Checks if value matches criteria.
-    criteria can be a set (exact/range match), a string (regex), 
-    or a comparator string like ">100" or "<100".
+    Parses a string like "0.1,0.2" into a (low, high) tuple of seconds.
+    Returns None if input is None or empty, raises ValueError if malformed.
     """
-    if criteria is None:
-        return False
-    
-    if mode == 'set':
-        if criteria == 'all':
-            return True
-        return value in criteria
-    
-    elif mode == 'text':
-        return criteria in value
-    
-    elif mode == 'comparator':
-        # criteria is like ">100" or "<100"
-        try:
-            if criteria.startswith('>'):
-                return value > int(criteria[1:])
-            elif criteria.startswith('<'):
-                return value < int(criteria[1:])
-            else:
-                return value == int(criteria)
-        except ValueError:
-            return False
-            
-    return False
+    if not value_str:
+        return None
+
+    parts = value_str.split(',')
+    if len(parts) == 1:
+        parts = parts * 2
+    low, high = map(float, parts)
+    if low < 0 or high < low:
+        raise ValueError(value_str)
+    return low, high
+
+def parse_comparator(value_str):
+    """
+    Parses a comparator string like ">100", "<100" or "100" into an
+    (operator, int) tuple. Returns None if malformed.
+    """
+    ops = {'>': operator.gt, '<': operator.lt}
+    op = ops.get(value_str[:1])
+    try:
+        if op:
+            return op, int(value_str[1:])
+        return operator.eq, int(value_str)
+    except ValueError:
+        return None
+
+def set_check(criteria):
+    if criteria == 'all':
+        return lambda v: True
+    return lambda v: v in criteria
+
+def text_check(criteria):
+    return lambda v: criteria in v
+
+def comparator_check(criteria):
+    parsed = parse_comparator(criteria)
+    if parsed is None:
+        return lambda v: False
+    op, limit = parsed
+    return lambda v: op(v, limit)
 
-def check_conditions(metrics, options, prefix):
+# Matcher (-m*) or filter (-f*) options, bound once before the scan.
+# c: status codes, l: lines, w: words, s: size, r: text, t: time
+MatcherSet = namedtuple('MatcherSet', 'c l w s r t mode')
+
+# A MatcherSet compiled into (metric, check) pairs and the any/all combinator
+Conditions = namedtuple('Conditions', 'mode_fn checks')
+
+def compile_conditions(ms):
     """
-    Generic checker for Matcher (-m*) or Filter (-f*) options.
-    prefix is 'm' for matchers or 'f' for filters.
-    Returns True if the conditions are met based on mode (and/or).
+    Compiles a MatcherSet of matchers or filters into Conditions,
+    so no option parsing or dispatching happens per response.
     """
     
-    # Map metric keys to option keys (e.g. 'status' -> 'mc')
     # metrics: status, lines, words, size, duration, body
     
     checks = []
     
     # Status Code (-mc / -fc)
-    if getattr(options, f'{prefix}c'):
-        val = getattr(options, f'{prefix}c')
-        checks.append(match_value(metrics['status'], val, 'set'))
+    if ms.c:
+        checks.append(('status', set_check(ms.c)))
 
     # Lines (-ml / -fl)
-    if getattr(options, f'{prefix}l'):
-        val = getattr(options, f'{prefix}l')
-        checks.append(match_value(metrics['lines'], val, 'set'))
+    if ms.l:
+        checks.append(('lines', set_check(ms.l)))
         
     # Words (-mw / -fw)
-    if getattr(options, f'{prefix}w'):
-        val = getattr(options, f'{prefix}w')
-        checks.append(match_value(metrics['words'], val, 'set'))
+    if ms.w:
+        checks.append(('words', set_check(ms.w)))
         
     # Size (-ms / -fs)
-    if getattr(options, f'{prefix}s'):
-        val = getattr(options, f'{prefix}s')
-        checks.append(match_value(metrics['size'], val, 'set'))
+    if ms.s:
+        checks.append(('size', set_check(ms.s)))
         
     # Text (-mr / -fr)
-    if getattr(options, f'{prefix}r'):
-        val = getattr(options, f'{prefix}r')
-        checks.append(match_value(metrics['body'], val, 'text'))
+    if ms.r:
+        checks.append(('body', text_check(ms.r)))
         
     # Time (-mt / -ft)
-    if getattr(options, f'{prefix}t'):
-        val = getattr(options, f'{prefix}t')
-        checks.append(match_value(metrics['duration'], val, 'comparator'))
+    if ms.t:
+        checks.append(('duration', comparator_check(ms.t)))
 
-    if not checks:
-        return False if prefix == 'f' else True # If no filters, return False (don't filter). If no matchers, see logic below.
-        
-    mode = getattr(options, f'{prefix}mode')
-    if mode == 'or':
-        return any(checks)
-    else: # and
-        return all(checks)
+    mode_fn = any if ms.mode == 'or' else all
+    return Conditions(mode_fn, checks)
+
+def check_conditions(metrics, conditions, is_filter):
+    """
+    Returns True if the compiled conditions are met based on mode (and/or).
+    """
+    if not conditions.checks:
+        return not is_filter # If no filters, return False (don't filter). If no matchers, match everything.
+
+    return conditions.mode_fn(check(metrics[key]) for key, check in conditions.checks)
+
+def early_decision(metrics, conditions, is_filter):
+    """
+    Evaluates conditions on the metrics known so far (None = not known yet).
+    Returns True/False once the outcome can't change, None otherwise.
+    Once every metric is known this is exactly check_conditions().
+    """
+    known = []
+    pending = False
+    for key, check in conditions.checks:
+        if metrics[key] is None:
+            pending = True
+        else:
+            known.append(check(metrics[key]))
+
+    if not pending:
+        return check_conditions(metrics, conditions, is_filter)
 
-def process_request(full_url, rel_path, options, headers):
+    if conditions.mode_fn is any:
+        return True if any(known) else None
+    return False if not all(known) else None
+
+def resolve_host(url):
+    """
+    Resolves the hostname of url once.
+    Returns (hostname, addresses) with every address in getaddrinfo order,
+    or None if the host is already an IP literal or can't be resolved
+    locally (e.g. only reachable via a proxy).
+    """
+    parsed = urlparse(url)
+    host = parsed.hostname
+    if not host:
+        return None
+    try:
+        ipaddress.ip_address(host)
+        return None
+    except ValueError:
+        pass
+    port = parsed.port or (443 if parsed.scheme == 'https' else 80)
     try:
-        # Random delay
-        time.sleep(random.uniform(0.1, 0.2))
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except (socket.gaierror, ValueError):
+        return None
+    addresses = list(dict.fromkeys(info[4][0] for info in infos))
+    return host, addresses
+
+class PinnedHostTransport(httpx.HTTPTransport):
+    """
+    HTTPTransport that connects to pre-resolved addresses for one hostname,
+    while keeping the real name in the Host header and TLS SNI.
+    Keep-alive already avoids most lookups; this saves the DNS round trip
+    whenever the pool opens a new connection (up to pool_size of them,
+    or after the server closes one).
+    Addresses that can't be connected to are dropped in turn, like the
+    normal connect path does; once none is left, the name is resolved
+    per connection again.
+    """
+    def __init__(self, host, addresses, **kwargs):
+        super().__init__(**kwargs)
+        self.pinned_host = host
+        self.addresses = list(addresses)
+        self.lock = threading.Lock()
+
+    def handle_request(self, request):
+        if request.url.host != self.pinned_host:
+            # e.g. a redirect to another host
+            return super().handle_request(request)
+
+        for address in list(self.addresses):
+            # Send a copy, so redirects and cookies keep seeing the real hostname.
+            # The Host header was already set from the original URL.
+            pinned = httpx.Request(
+                request.method,
+                request.url.copy_with(host=address),
+                headers=request.headers,
+                stream=request.stream,
+                extensions={**request.extensions, 'sni_hostname': self.pinned_host},
+            )
+            try:
+                return super().handle_request(pinned)
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                # Nothing was sent yet, so trying elsewhere is safe
+                self.drop_address(address, e)
+
+        return super().handle_request(request)
+
+    def drop_address(self, address, error):
+        with self.lock:
+            if address not in self.addresses:
+                return # Already dropped by another worker
+            self.addresses.remove(address)
+            fallback = "trying next address" if self.addresses else "resolving normally"
+        sys.stderr.write(f"{COLOR_WARN}Warning: {self.pinned_host} ({address}) unreachable: {error}, {fallback}{COLOR_RESET}\n")
+
+def proxy_for(url, scheme):
+    """
+    Returns the proxy URL to use for scheme requests to url's host, from
+    the HTTP(S)_PROXY / ALL_PROXY environment variables (honouring NO_PROXY),
+    like requests did. None for direct.
+    """
+    host = urlparse(url).hostname
+    if host and proxy_bypass(host):
+        return None
+    proxies = getproxies()
+    return proxies.get(scheme) or proxies.get('all')
+
+def build_client(url, headers, pool_size=1):
+    """
+    Builds an httpx.Client shared by the whole scan.
+    Every request targets the same host, so a single keep-alive pool
+    avoids a new TCP/TLS handshake per file (and with HTTP/2, workers
+    share one connection), and the host is resolved only once.
+    Requests going through a proxy are not pinned, the proxy resolves them.
+    """
+    transport_kwargs = dict(
+        verify=False,
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        retries=0
+    )
+    resolved = None
+    mounts = {}
+    for scheme in ('http', 'https'):
+        scheme_proxy = proxy_for(url, scheme)
+        if scheme_proxy:
+            mounts[f"{scheme}://"] = httpx.HTTPTransport(proxy=scheme_proxy, **transport_kwargs)
+            continue
+        if resolved is None:
+            resolved = resolve_host(url) or ()
+        if resolved:
+            mounts[f"{scheme}://"] = PinnedHostTransport(*resolved, **transport_kwargs)
+        else:
+            mounts[f"{scheme}://"] = httpx.HTTPTransport(**transport_kwargs)
+    return httpx.Client(headers=headers, timeout=10, mounts=mounts)
+
+def content_length(response):
+    """
+    Returns the body size announced by the server, or None if it can't be
+    trusted (missing header, or compressed body that httpx would decode).
+    HEAD requests and 1xx/204/304 responses never carry a body, whatever
+    Content-Length says.
+    """
+    if response.request.method == 'HEAD' or response.status_code < 200 or response.status_code in (204, 304):
+        return 0
+    if response.headers.get('Content-Encoding', 'identity').lower() != 'identity':
+        return None
+    try:
+        return int(response.headers['Content-Length'])
+    except (KeyError, ValueError):
+        return None
+
+def drain(response, limit=DRAIN_LIMIT):
+    """
+    Reads and discards the body so the connection can be reused, stopping as
+    soon as more than limit bytes came over the wire (chunked or compressed
+    bodies don't announce their size). Returns the decoded body size, or None
+    if it stopped early; closing the response then drops the connection.
+    """
+    size = 0
+    for chunk in response.iter_bytes():
+        size += len(chunk)
+        if response.num_bytes_downloaded > limit:
+            return None
+    return size
+
+def count_lines(content):
+    if not content:
+        return 0
+    return content.count(b'\n') + (0 if content.endswith(b'\n') else 1)
+
+def process_request(client, limiter, full_url, rel_path, options):
+    try:
+        # Throttling (both are no-ops unless --rps / --jitter are given)
+        if limiter:
+            limiter.acquire()
+        if options.jitter:
+            random_delay(*options.jitter)
         
         start_time = time.time()
         
         # Method
         method = options.method.upper()
         
-        response = requests.request(
-            method, 
-            full_url, 
-            headers=headers, 
-            timeout=10, 
-            verify=False,
-            allow_redirects=options.follow_redirects
+        # Stream so the body is only downloaded when a metric needs it
+        response = client.send(
+            client.build_request(method, full_url),
+            follow_redirects=options.follow_redirects,
+            stream=True
         )
         
         duration = int((time.time() - start_time) * 1000)
         
         # Collect Metrics
-        content = response.content
-        text = response.text
+        try:
+            # Known from the headers alone, the rest needs the body
+            metrics = {
+                'status': response.status_code,
+                'size': content_length(response),
+                'words': None,
+                'lines': None,
+                'duration': duration,
+                'body': None
+            }
+            needs_read = options.needs_body or (metrics['size'] is None and options.needs_size)
+            
+            # Outcome already settled by the header metrics (typically a 404
+            # that -mc doesn't match): don't download the body for nothing
+            decided = needs_read and (
+                (options.has_filters and early_decision(metrics, options.filters, True) is True)
+                or early_decision(metrics, options.matchers, False) is False
+            )
+            
+            if needs_read and not decided:
+                # Work on raw bytes, no metric needs the decoded text
+                content = response.read()
+                metrics.update({
+                    'size': len(content),
+                    'words': len(content.split()),
+                    'lines': count_lines(content),
+                    'body': content
+                })
+            elif metrics['size'] is None or metrics['size'] <= DRAIN_LIMIT:
+                # Keep the connection alive, and size unannounced bodies
+                drained = drain(response)
+                if metrics['size'] is None:
+                    metrics['size'] = drained
+        finally:
+            response.close()
         
-        metrics = {
-            'status': response.status_code,
-            'size': len(content),
-            'words': len(text.split()),
-            'lines': len(text.splitlines()),
-            'duration': duration,
-            'body': text
-        }
+        if decided:
+            return
         
         # 1. Check Filters
         # Use default filter logic: if NO filters specified, is_filtered=False.
         # If filters specified, apply them.
-        has_filters = any([options.fc, options.fl, options.fw, options.fs, options.fr, options.ft])
-        if has_filters:
-            if check_conditions(metrics, options, 'f'):
+        if options.has_filters:
+            if check_conditions(metrics, options.filters, True):
                 return # Filtered out
         
         # 2. Check Matchers
@@ -200,28 +494,73 @@ def process_request(full_url, rel_path, options, headers):
         # If user explicitly disabled mc (e.g. -mc ""), we might need to handle that.
         # But generally, we check if it matches.
         
-        if check_conditions(metrics, options, 'm'):
+        if check_conditions(metrics, options.matchers, False):
             # Print Result
-            status_color = COLOR_DEFAULT
-            if metrics['status'] in [200, 204]:
-                status_color = COLOR_SUCCESS
-            elif metrics['status'] in [301, 302, 307]:
-                status_color = COLOR_INFO
-            elif metrics['status'] in [401, 403]:
-                status_color = COLOR_WARN
-            elif metrics['status'] >= 500:
-                status_color = COLOR_ERROR
-            
-            size_fmt = metrics['size']
-            words_fmt = metrics['words']
-            lines_fmt = metrics['lines']
+            line = RESULT_FORMAT.format_map({
+                'rel_path': rel_path,
+                'color': color_for(metrics['status']),
+                'status': metrics['status'],
+                'size': 'N/A' if metrics['size'] is None else metrics['size'],
+                'words': 'N/A' if metrics['words'] is None else metrics['words'],
+                'lines': 'N/A' if metrics['lines'] is None else metrics['lines'],
+                'duration': duration
+            })
             
-            print(f"{rel_path:<30} {COLOR_RESET}[Status: {status_color}{metrics['status']}{COLOR_RESET}, Size: {size_fmt}, Words: {words_fmt}, Lines: {lines_fmt}, Duration: {duration}ms]")
+            out_q.put(line)
 
-    except requests.exceptions.RequestException:
+    except httpx.HTTPError:
         pass
     except Exception as e:
-        print(f"{COLOR_ERROR}Error processing {full_url}: {e}{COLOR_RESET}", file=sys.stderr)
+        # Single write call so concurrent errors don't interleave
+        sys.stderr.write(f"{COLOR_ERROR}Error processing {full_url}: {e}{COLOR_RESET}\n")
+
+def walk_files(base_dir):
+    """
+    Yields the path of every file under base_dir, relative to it and with '/'
+    separators. Same files as os.walk (symlinked directories aren't followed,
+    unreadable ones are skipped), but straight from os.scandir entries,
+    without building per-directory lists or joining paths.
+    """
+    stack = [(base_dir, '')]
+    while stack:
+        path, prefix = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        yield prefix + entry.name
+                    elif not entry.is_symlink():
+                        subdirs.append((entry.path, f"{prefix}{entry.name}/"))
+        except OSError:
+            continue
+        # Reversed so directories come off the stack in listing order
+        stack.extend(reversed(subdirs))
+
+def iter_files(base_dir, base_url, exclude=None):
+    """
+    Yields (full_url, rel_path) for every file under base_dir.
+    Files whose rel_path matches the exclude regex are skipped.
+    """
+    base = base_url.rstrip('/')
+    for rel_path in walk_files(base_dir):
+        if exclude and exclude.search(rel_path):
+            continue
+        yield f"{base}/{quote(rel_path, safe=URL_PATH_SAFE)}", rel_path
+
+def worker(work_q, client, limiter, options):
+    """
+    Pulls (full_url, rel_path) items off work_q until it gets None.
+    """
+    while True:
+        item = work_q.get()
+        if item is None:
+            return
+        process_request(client, limiter, item[0], item[1], options)
 
 def main():
     parser = argparse.ArgumentParser(description="Broken Access Control (BAC) testing tool", formatter_class=argparse.RawTextHelpFormatter)
@@ -232,6 +571,10 @@ def main():
     parser.add_argument("-H", "--header", action='append', help="Header 'Name: Value', separated by colon. Multiple -H flags are accepted.")
     parser.add_argument("-X", "--method", default="GET", help="HTTP method to use (default: GET)")
     parser.add_argument("-r", "--follow-redirects", action='store_true', help="Follow redirects (default: false)")
+    parser.add_argument("-e", "--exclude", help="Skip local files whose relative path matches this regex\n(e.g. '\\.(pyc|o|class|a)$|^\\.git/')")
+    parser.add_argument("-t", "--threads", type=int, default=20, help="Number of concurrent requests (default: 20)")
+    parser.add_argument("--rps", type=float, help="Maximum requests per second across all threads (default: unlimited)")
+    parser.add_argument("--jitter", help="Random delay in seconds before each request, as 'LO,HI' (e.g. 0.1,0.2)")
     
     # Matcher Options
     group_m = parser.add_argument_group('MATCHER OPTIONS')
@@ -266,6 +609,20 @@ def main():
     args.fl = parse_range_list(args.fl)
     args.fw = parse_range_list(args.fw)
     args.fs = parse_range_list(args.fs)
+
+    # Text matchers are searched in the raw response bytes
+    if args.mr:
+        args.mr = args.mr.encode()
+    if args.fr:
+        args.fr = args.fr.encode()
+
+    args.matchers = compile_conditions(MatcherSet(args.mc, args.ml, args.mw, args.ms, args.mr, args.mt, args.mmode))
+    args.filters = compile_conditions(MatcherSet(args.fc, args.fl, args.fw, args.fs, args.fr, args.ft, args.fmode))
+    args.has_filters = bool(args.filters.checks)
+
+    # Only download bodies when a body-based matcher/filter is used
+    args.needs_body = any([args.mr, args.fr, args.mw, args.fw, args.ml, args.fl])
+    args.needs_size = any([args.ms, args.fs])
     
     # 2. Prepare headers
     headers = parse_headers(args.header)
@@ -277,6 +634,30 @@ def main():
         print(f"{COLOR_ERROR}Erreur: Le dossier '{args.dir}' n'existe pas.{COLOR_RESET}")
         sys.exit(1)
 
+    if args.threads < 1:
+        print(f"{COLOR_ERROR}Erreur: --threads doit être >= 1.{COLOR_RESET}")
+        sys.exit(1)
+
+    if args.rps is not None and args.rps <= 0:
+        print(f"{COLOR_ERROR}Erreur: --rps doit être > 0.{COLOR_RESET}")
+        sys.exit(1)
+
+    try:
+        args.jitter = parse_jitter(args.jitter)
+    except ValueError:
+        print(f"{COLOR_ERROR}Erreur: --jitter invalide '{args.jitter}' (attendu: LO,HI).{COLOR_RESET}")
+        sys.exit(1)
+
+    limiter = RateLimiter(args.rps) if args.rps else None
+
+    exclude = None
+    if args.exclude:
+        try:
+            exclude = re.compile(args.exclude)
+        except re.error as e:
+            print(f"{COLOR_ERROR}Erreur: --exclude invalide '{args.exclude}': {e}{COLOR_RESET}")
+            sys.exit(1)
+
     print_banner()
     
     # Print Configuration
@@ -284,26 +665,53 @@ def main():
     print(f" :: {COLOR_INFO}URL{COLOR_RESET}              : {args.url}")
     print(f" :: {COLOR_INFO}Wiki{COLOR_RESET}             : {args.dir}")
     print(f" :: {COLOR_INFO}Follow Redirects{COLOR_RESET} : {args.follow_redirects}")
+    print(f" :: {COLOR_INFO}Threads{COLOR_RESET}          : {args.threads}")
+    # httpx only offers h2 over TLS (ALPN); the server may still pick HTTP/1.1
+    if urlparse(args.url).scheme == 'https':
+        http2_state = "offered" if HTTP2_AVAILABLE else "disabled (needs h2)"
+        print(f" :: {COLOR_INFO}HTTP/2{COLOR_RESET}           : {http2_state}")
+    if args.exclude:
+        print(f" :: {COLOR_INFO}Exclude{COLOR_RESET}          : {args.exclude}")
+    if args.rps:
+        print(f" :: {COLOR_INFO}Rate Limit{COLOR_RESET}       : {args.rps} req/s")
+    if args.jitter:
+        print(f" :: {COLOR_INFO}Jitter{COLOR_RESET}           : {args.jitter[0]}-{args.jitter[1]}s")
     for k, v in headers.items():
         print(f" :: {COLOR_INFO}Header{COLOR_RESET}           : {k}: {v}")
     
     print(f"{COLOR_CYAN}_{'_'*40}{COLOR_RESET}")
     print()
 
+    printer_thread = threading.Thread(target=printer, daemon=True)
+    printer_thread.start()
+
     try:
-        for root, dirs, files in os.walk(args.dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                # Construct relative path
-                rel_path = os.path.relpath(file_path, args.dir)
-                rel_path = rel_path.replace(os.sep, '/')
-                full_url = f"{args.url.rstrip('/')}/{rel_path}"
-                
-                process_request(full_url, rel_path, args, headers)
+        with build_client(args.url, headers, pool_size=args.threads) as client:
+            # Bounded so traversal stays just ahead of the workers
+            work_q = queue.Queue(maxsize=2 * args.threads)
+            threads = [
+                threading.Thread(target=worker, args=(work_q, client, limiter, args), daemon=True)
+                for _ in range(args.threads)
+            ]
+            for t in threads:
+                t.start()
+
+            for item in iter_files(args.dir, args.url, exclude):
+                work_q.put(item)
+            for _ in threads:
+                work_q.put(None)
+            for t in threads:
+                t.join()
                 
     except KeyboardInterrupt:
+        # Workers are daemon threads, pending items are simply dropped
+        out_q.put(None)
+        printer_thread.join(timeout=1)
         print(f"\n{COLOR_WARN}Scan interrupted by user.{COLOR_RESET}")
         sys.exit(0)
 
+    out_q.put(None)
+    printer_thread.join()
+
 if __name__ == "__main__":
     main()